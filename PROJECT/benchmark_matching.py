@@ -0,0 +1,295 @@
+"""Synthetic-data benchmark for the job matching pipeline.
+
+Generates users, candidate profiles, candidate skills, job postings and job
+required skills at the requested sizes in a scratch database, then times
+calculate_job_match_score, get_job_recommendations,
+notify_matching_candidates and the candidate dashboard view end to end. For every benchmark the number of SQL
+statements issued, wall time and peak traced memory are reported and saved
+as JSON, so runs from different commits can be compared with --compare.
+
+    python benchmark_matching.py --candidates 100000 --jobs 10000
+    python benchmark_matching.py --compare benchmark_results/<previous>.json
+
+The target database is dropped and recreated on every run; point
+--database-uri at a scratch database, never at real data.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+
+LOCATIONS = ['Dhaka', 'Dhaka, Bangladesh', 'Gulshan, Dhaka', 'Chattogram', 'Sylhet', 'Khulna',
+             'Bangladesh', 'Remote', 'Kolkata, India', 'Bengaluru', 'London, UK', 'Berlin',
+             'Singapore', 'New York, NY', '']
+JOB_TITLES = ['Software Engineer', 'Backend Developer', 'Frontend Developer', 'Data Engineer',
+              'Data Scientist', 'DevOps Engineer', 'QA Engineer', 'Mobile Developer',
+              'Product Manager', 'UI/UX Designer']
+JOB_TYPES = ['Full-time', 'Part-time', 'Contract', 'Internship']
+IMPORTANCE = ['Required', 'Preferred', 'Nice to have']
+INSERT_CHUNK_SIZE = 5000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--candidates', type=int, default=10000)
+    parser.add_argument('--jobs', type=int, default=1000)
+    parser.add_argument('--skills', type=int, default=500)
+    parser.add_argument('--skills-per-candidate', type=int, default=8)
+    parser.add_argument('--skills-per-job', type=int, default=6)
+    parser.add_argument('--pairs', type=int, default=200,
+                        help='candidate/job pairs scored with calculate_job_match_score')
+    parser.add_argument('--recommendation-samples', type=int, default=50,
+                        help='candidates passed to get_job_recommendations')
+    parser.add_argument('--notify-samples', type=int, default=5,
+                        help='jobs passed to notify_matching_candidates')
+    parser.add_argument('--dashboard-samples', type=int, default=50,
+                        help='candidates whose dashboard is loaded')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--database-uri', default='sqlite:///' + os.path.abspath('benchmark_matching.db'),
+                        help='scratch database; it is dropped and recreated')
+    parser.add_argument('--output', default=None,
+                        help='result file (default benchmark_results/<timestamp>-<commit>.json)')
+    parser.add_argument('--compare', default=None, help='earlier result file to compare against')
+    return parser.parse_args()
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class QueryCounter:
+    """Counts SQL statements sent through an engine"""
+
+    def __init__(self, engine):
+        self.count = 0
+        from sqlalchemy import event
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+class Measurement:
+    """Wall time, statement count and peak traced memory of a block of calls"""
+
+    def __init__(self, counter):
+        self.counter = counter
+        self.call_times = []
+
+    def __enter__(self):
+        tracemalloc.reset_peak()
+        self.queries_before = self.counter.count
+        self.started = time.perf_counter()
+        return self
+
+    def call(self, fn, *args, **kwargs):
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.call_times.append(time.perf_counter() - started)
+        return result
+
+    def __exit__(self, *exc):
+        self.wall_time = time.perf_counter() - self.started
+        self.queries = self.counter.count - self.queries_before
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+
+    def result(self):
+        calls = len(self.call_times)
+        times = sorted(self.call_times)
+        return {
+            'calls': calls,
+            'wall_time_s': round(self.wall_time, 6),
+            'mean_ms': round(1000 * self.wall_time / calls, 3) if calls else None,
+            'p95_ms': round(1000 * times[int(0.95 * (calls - 1))], 3) if calls else None,
+            'max_ms': round(1000 * times[-1], 3) if calls else None,
+            'queries': self.queries,
+            'queries_per_call': round(self.queries / calls, 2) if calls else None,
+            'peak_memory_bytes': self.peak_memory
+        }
+
+
+def insert_rows(main, model, rows):
+    table = model.__table__
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        main.db.session.execute(table.insert(), rows[start:start + INSERT_CHUNK_SIZE])
+
+
+def generate_data(main, args, rnd):
+    """Bulk-load synthetic rows with explicit ids into the empty schema"""
+    now = datetime.utcnow()
+    salaries = [None] + [Decimal(amount) for amount in range(20000, 200001, 10000)]
+
+    insert_rows(main, main.Skill, [
+        {'id': i, 'skill_name': f'Skill {i}', 'category': f'Category {i % 12}', 'created_at': now}
+        for i in range(1, args.skills + 1)
+    ])
+
+    users = [{'id': 1, 'email': 'employer@benchmark.local', 'password_hash': '-',
+              'user_type': 'employer', 'first_name': 'Bench', 'last_name': 'Employer',
+              'is_active': True, 'created_at': now}]
+    users += [{'id': i + 1, 'email': f'candidate{i}@benchmark.local', 'password_hash': '-',
+               'user_type': 'candidate', 'first_name': 'Candidate', 'last_name': str(i),
+               'is_active': rnd.random() < 0.95, 'created_at': now}
+              for i in range(1, args.candidates + 1)]
+    insert_rows(main, main.User, users)
+    insert_rows(main, main.Company, [{'id': 1, 'user_id': 1, 'company_name': 'Benchmark Ltd',
+                                      'location': 'Dhaka', 'created_at': now}])
+
+    insert_rows(main, main.CandidateProfile, [{
+        'id': i, 'user_id': i + 1,
+        'experience_years': rnd.randint(0, 15),
+        'location': rnd.choice(LOCATIONS),
+        'salary_expectation': rnd.choice(salaries),
+        'created_at': now
+    } for i in range(1, args.candidates + 1)])
+    insert_rows(main, main.CandidateSkill, [
+        {'candidate_id': i, 'skill_id': skill_id, 'proficiency_level': 'Intermediate', 'years_experience': 0}
+        for i in range(1, args.candidates + 1)
+        for skill_id in rnd.sample(range(1, args.skills + 1),
+                                   min(args.skills, rnd.randint(0, 2 * args.skills_per_candidate)))
+    ])
+
+    jobs = []
+    for i in range(1, args.jobs + 1):
+        salary_min = rnd.choice(salaries)
+        jobs.append({
+            'id': i, 'company_id': 1,
+            'title': rnd.choice(JOB_TITLES), 'description': 'Synthetic benchmark posting',
+            'location': rnd.choice(LOCATIONS), 'job_type': rnd.choice(JOB_TYPES),
+            'experience_required': rnd.randint(0, 10),
+            'salary_min': salary_min,
+            'salary_max': salary_min + Decimal(rnd.choice([0, 10000, 30000, 60000])) if salary_min else None,
+            'is_active': rnd.random() < 0.9, 'created_at': now
+        })
+    insert_rows(main, main.JobPosting, jobs)
+    insert_rows(main, main.JobRequiredSkill, [
+        {'job_id': i, 'skill_id': skill_id, 'importance': rnd.choice(IMPORTANCE)}
+        for i in range(1, args.jobs + 1)
+        for skill_id in rnd.sample(range(1, args.skills + 1),
+                                   min(args.skills, rnd.randint(0, 2 * args.skills_per_job)))
+    ])
+    main.db.session.commit()
+
+
+def run_benchmarks(main, args, rnd, counter):
+    results = {}
+    candidate_ids = list(range(1, args.candidates + 1))
+    job_ids = list(range(1, args.jobs + 1))
+
+    with Measurement(counter) as m:
+        for _ in range(args.pairs):
+            m.call(main.calculate_job_match_score, rnd.choice(candidate_ids), rnd.choice(job_ids))
+    results['calculate_job_match_score'] = m.result()
+
+    sample = rnd.sample(candidate_ids, min(args.recommendation_samples, len(candidate_ids)))
+    with Measurement(counter) as m:
+        for candidate_id in sample:
+            m.call(main.get_job_recommendations, candidate_id)
+    results['get_job_recommendations_cold'] = m.result()
+    main.db.session.expire_all()
+    with Measurement(counter) as m:
+        for candidate_id in sample:
+            m.call(main.get_job_recommendations, candidate_id)
+    results['get_job_recommendations_warm'] = m.result()
+
+    sample = rnd.sample(job_ids, min(args.notify_samples, len(job_ids)))
+    with Measurement(counter) as m:
+        for job_id in sample:
+            m.call(main.notify_matching_candidates, job_id, action_url=f'/job/{job_id}')
+    results['notify_matching_candidates'] = m.result()
+    results['notify_matching_candidates']['notifications'] = main.Notification.query.count()
+
+    # The page templates are static mockups; time the view's data work only
+    main.render_template = lambda template, **context: ''
+    sample = rnd.sample(candidate_ids, min(args.dashboard_samples, len(candidate_ids)))
+    for run in ('cold', 'warm'):
+        main.db.session.expire_all()
+        with Measurement(counter) as m:
+            for candidate_id in sample:
+                with main.app.test_request_context('/candidate/dashboard'):
+                    main.session['user_id'] = candidate_id + 1
+                    main.session['user_type'] = 'candidate'
+                    m.call(main.candidate_dashboard)
+        results[f'candidate_dashboard_{run}'] = m.result()
+    return results
+
+
+def compare(results, previous_path):
+    with open(previous_path) as f:
+        previous = json.load(f)
+    print(f"\nCompared with {previous_path} (commit {previous.get('commit')}):")
+    for name, result in results.items():
+        before = previous.get('results', {}).get(name)
+        if not before:
+            continue
+        for metric in ('wall_time_s', 'queries', 'peak_memory_bytes'):
+            if before.get(metric):
+                print(f'  {name:32} {metric:18} {before[metric]:>14} -> {result[metric]:>14}'
+                      f'  ({result[metric] / before[metric]:.2f}x)')
+
+
+def main():
+    args = parse_args()
+    os.environ['JOBMATCH_DATABASE_URI'] = args.database_uri
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import main as app_module
+
+    rnd = random.Random(args.seed)
+    tracemalloc.start()
+    with app_module.app.app_context():
+        app_module.db.drop_all()
+        app_module.db.create_all()
+
+        started = time.perf_counter()
+        generate_data(app_module, args, rnd)
+        generation_time = time.perf_counter() - started
+        print(f'Generated {args.candidates} candidates and {args.jobs} jobs in {generation_time:.1f}s')
+
+        counter = QueryCounter(app_module.db.engine)
+        results = run_benchmarks(app_module, args, rnd, counter)
+        database = app_module.db.engine.url.get_backend_name()
+    tracemalloc.stop()
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'timestamp': datetime.utcnow().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'database': database,
+        'config': {key: value for key, value in vars(args).items()
+                   if key not in ('database_uri', 'output', 'compare')},
+        'generation_time_s': round(generation_time, 3),
+        'results': results
+    }
+
+    for name, result in results.items():
+        print(f"{name:32} {result['calls']:>6} calls  {result['wall_time_s']:>10.3f}s  "
+              f"{result['queries']:>8} queries  {result['peak_memory_bytes'] / 2**20:>8.1f} MiB peak")
+
+    output = args.output
+    if output is None:
+        stamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
+        output = os.path.join('benchmark_results', f"{stamp}-{commit or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'Results saved to {output}')
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+// Skill suggestions for free-text skill inputs, served by /api/autocomplete
+// Usage: <input list="someDatalist" data-skill-autocomplete> plus an empty <datalist id="someDatalist">
+(function () {
+    const DEBOUNCE_MS = 150;
+
+    function attachSkillAutocomplete(input) {
+        const datalist = document.getElementById(input.getAttribute('list'));
+        if (!datalist) {
+            return;
+        }
+        let timer = null;
+        let latest = 0;
+
+        input.setAttribute('autocomplete', 'off');
+        input.addEventListener('input', () => {
+            clearTimeout(timer);
+            const query = input.value.trim();
+            if (!query) {
+                datalist.innerHTML = '';
+                return;
+            }
+            timer = setTimeout(() => {
+                const request = ++latest;
+                fetch(`/api/autocomplete?kind=skill&q=${encodeURIComponent(query)}`)
+                    .then(response => response.ok ? response.json() : { suggestions: [] })
+                    .then(data => {
+                        if (request !== latest) {
+                            return; // a newer keystroke already asked
+                        }
+                        datalist.innerHTML = '';
+                        data.suggestions.forEach(suggestion => {
+                            const option = document.createElement('option');
+                            option.value = suggestion.label;
+                            datalist.appendChild(option);
+                        });
+                    })
+                    .catch(error => console.error('Skill suggestions failed:', error));
+            }, DEBOUNCE_MS);
+        });
+    }
+
+    document.addEventListener('DOMContentLoaded', () => {
+        document.querySelectorAll('input[data-skill-autocomplete]').forEach(attachSkillAutocomplete);
+    });
+})();
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('JOBMATCH_DATABASE_URI', 'sqlite://')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """The application bound to a fresh in-memory SQLite database"""
+    main.app.config['TESTING'] = True
+    with main.app.app_context():
+        main.db.create_all()
+        yield main.app
+        main.db.session.remove()
+        main.db.drop_all()
@@ -0,0 +1,94 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+import main
+from main import db
+
+
+LOCATIONS = [None, '', 'Dhaka', 'Dhaka, Bangladesh', 'Chittagong', 'Remote', 'London, UK', 'Berlin']
+
+
+@pytest.fixture
+def seeded(app):
+    """Candidates and jobs covering every branch of calculate_job_match_score"""
+    rng = random.Random(7)
+    skills = [main.Skill(skill_name=f'skill-{i}') for i in range(12)]
+    db.session.add_all(skills)
+    employer = main.User(email='employer@example.com', password_hash='x', user_type='employer',
+                         first_name='E', last_name='Mployer')
+    db.session.add(employer)
+    db.session.flush()
+    company = main.Company(user_id=employer.id, company_name='Acme')
+    db.session.add(company)
+    db.session.flush()
+
+    for i in range(15):
+        salary_min = rng.choice([None, 30000, 50000])
+        job = main.JobPosting(
+            company_id=company.id, title=f'Job {i}', description='...',
+            location=rng.choice(LOCATIONS), experience_required=rng.choice([0, 2, 5, 10]),
+            salary_min=salary_min and Decimal(salary_min),
+            salary_max=salary_min and Decimal(salary_min + rng.choice([0, 20000])),
+        )
+        db.session.add(job)
+        db.session.flush()
+        for skill in rng.sample(skills, rng.randint(0, 5)):
+            db.session.add(main.JobRequiredSkill(
+                job_id=job.id, skill_id=skill.id,
+                importance=rng.choice(['Required', 'Preferred', 'Nice to have'])))
+
+    for i in range(10):
+        user = main.User(email=f'candidate{i}@example.com', password_hash='x', user_type='candidate',
+                         first_name='C', last_name=str(i))
+        db.session.add(user)
+        db.session.flush()
+        candidate = main.CandidateProfile(
+            user_id=user.id, experience_years=rng.randint(0, 12), location=rng.choice(LOCATIONS),
+            salary_expectation=rng.choice([None, Decimal('25000'), Decimal('55000.50'),
+                                           Decimal('60000'), Decimal('90000')]),
+        )
+        db.session.add(candidate)
+        db.session.flush()
+        for skill in rng.sample(skills, rng.randint(0, 6)):
+            db.session.add(main.CandidateSkill(candidate_id=candidate.id, skill_id=skill.id))
+
+    db.session.commit()
+    return ([c.id for c in main.CandidateProfile.query.all()],
+            [j.id for j in main.JobPosting.query.all()])
+
+
+def test_score_job_matches_equals_per_pair_score(seeded):
+    candidate_ids, job_ids = seeded
+    matrix = main.load_job_match_matrix(job_ids)
+    for candidate_id in candidate_ids:
+        candidate = db.session.get(main.CandidateProfile, candidate_id)
+        scores = main.score_job_matches(candidate, main.candidate_skill_id_list(candidate_id), matrix)
+        for job_id, score in zip(matrix.job_ids.tolist(), scores.tolist()):
+            assert score == main.calculate_job_match_score(candidate_id, job_id), (candidate_id, job_id)
+
+
+def test_score_candidate_matches_equals_per_pair_score(seeded):
+    candidate_ids, job_ids = seeded
+    matrix = main.load_candidate_match_matrix(candidate_ids)
+    for job_id in job_ids:
+        job = db.session.get(main.JobPosting, job_id)
+        scores = main.score_candidate_matches(job, main.load_job_required_skills([job_id]), matrix)
+        for candidate_id, score in zip(matrix.candidate_ids.tolist(), scores.tolist()):
+            assert score == main.calculate_job_match_score(candidate_id, job_id), (candidate_id, job_id)
+
+
+def test_check_match_parity_command(seeded, app):
+    result = app.test_cli_runner().invoke(args=['check-match-parity'])
+    assert result.exit_code == 0, result.output
+    assert '0 mismatches' in result.output
+
+
+def test_recommendations_below_stored_cutoff_are_scored_live(seeded):
+    candidate_ids, _ = seeded
+    for candidate_id in candidate_ids:
+        stored = main.get_job_recommendations(candidate_id, k=20)
+        live = main.get_job_recommendations(candidate_id, k=20, threshold=0)
+        assert [rec for rec in live if rec['match_score'] > main.RECOMMENDATION_MIN_SCORE] == stored
+        assert all(rec['match_score'] > 0 for rec in live)
@@ -410,33 +410,6 @@ CREATE TABLE `job_postings` (
 INSERT INTO `job_postings` (`id`, `company_id`, `title`, `description`, `requirements`, `location`, `job_type`, `experience_required`, `salary_min`, `salary_max`, `application_deadline`, `is_active`, `created_at`, `updated_at`) VALUES
 (1, 1, 'Software Engineer', 'Job Title: Software Engineer\r\nLocation: [Your City, Country or Remote]\r\nJob Type: Full-time\r\nExperience Level: Entry-level / Mid-level / Senior (choose one)\r\n\r\nAbout the Role:\r\nWe are looking for a passionate and skilled Software Engineer to join our growing team. In this role, you will be responsible for designing, developing, testing, and maintaining scalable and robust software solutions. You will collaborate with cross-functional teams to understand requirements and deliver high-quality products that meet customer needs.\r\n\r\nKey Responsibilities:\r\nDesign, develop, and deploy scalable and maintainable software applications.\r\n\r\nWrite clean, efficient, and well-documented code.\r\n\r\nParticipate in code reviews and provide constructive feedback.\r\n\r\nCollaborate with product managers, designers, and other developers to define and implement new features.\r\n\r\nDebug and resolve software defects and performance issues.\r\n\r\nContinuously learn and apply new technologies and industry best practices.\r\n\r\nContribute to architectural discussions and decisions.', 'Required Qualifications:\r\nBachelor’s degree in Computer Science, Engineering, or a related field.\r\n\r\nProficiency in one or more programming languages such as Java, Python, JavaScript, C++, or Go.\r\n\r\nStrong understanding of software development principles, data structures, and algorithms.\r\n\r\nExperience with version control systems like Git.\r\n\r\nFamiliarity with software development tools and agile methodologies.\r\n\r\nPreferred Qualifications:\r\nExperience with cloud platforms such as AWS, Azure, or Google Cloud.\r\n\r\nKnowledge of database technologies like MySQL, PostgreSQL, MongoDB.\r\n\r\nFamiliarity with frontend frameworks (e.g., React, Angular, Vue) and/or backend frameworks (e.g., Spring, Django, Node.js).\r\n\r\nUnderstanding of CI/CD pipelines and DevOps practices.\r\n\r\nExcellent problem-solving skills and attention to detail.', 'Dhaka', 'Full-time', 1, 17000.00, 20000.00, '2025-07-31', 1, '2025-07-01 12:16:23', '2025-07-01 12:16:23');
 
---
--- Triggers `job_postings`
---
-DELIMITER $$
-CREATE TRIGGER `before_job_posting_select` BEFORE UPDATE ON `job_postings` FOR EACH ROW BEGIN
-    IF NEW.application_deadline < CURDATE() AND OLD.is_active = TRUE THEN
-        SET NEW.is_active = FALSE;
-        
-        -- Create notification for employer
-        INSERT INTO notifications (
-            user_id, 
-            title, 
-            message, 
-            notification_type
-        )
-        SELECT 
-            c.user_id,
-            'Job Posting Expired',
-            CONCAT('Your job posting "', NEW.title, '" has expired and been deactivated.'),
-            'system'
-        FROM companies c 
-        WHERE c.id = NEW.company_id;
-    END IF;
-END
-$$
-DELIMITER ;
-
 -- --------------------------------------------------------
 
 --